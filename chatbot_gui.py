@@ -1,10 +1,31 @@
 import streamlit as st
+import diskcache
+import hashlib
+import json
+import os
+import sqlite3
 import time
-from datetime import datetime
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import chain
 from typing import Generator, Tuple
 import asyncio
 from mock_supervisor import MockSupervisor
 
+# Number of messages kept in memory; older ones are spilled to SQLite
+MAX_VISIBLE_MESSAGES = 200
+# Number of spilled messages fetched per "Load older messages" click
+HISTORY_BATCH_SIZE = 50
+# Upper bound on loaded older messages kept while new ones keep spilling
+MAX_OLDER_MESSAGES = 200
+HISTORY_DB_PATH = os.path.expanduser("~/.etisalat_history.sqlite3")
+# Sessions whose newest spilled message is older than this are deleted
+HISTORY_MAX_AGE = timedelta(days=7)
+RESPONSE_CACHE_DIR = os.path.expanduser("~/.etisalat_cache")
+# Seconds a cached supervisor response stays valid
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
 # Page configuration
 st.set_page_config(
     page_title="AI Assistant Chat Interface",
@@ -13,205 +34,351 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for modern styling
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .chat-container {
-        max-height: 600px;
-        overflow-y: auto;
-        padding: 1rem;
-        border: 1px solid #e0e0e0;
-        border-radius: 10px;
-        background-color: #fafafa;
-        margin-bottom: 1rem;
-    }
-    
-    .user-message {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 15px 15px 5px 15px;
-        margin: 0.5rem 0;
-        margin-left: 20%;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .ai-message {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 15px 15px 15px 5px;
-        margin: 0.5rem 0;
-        margin-right: 20%;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .ai-thoughts {
-        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        color: #333;
-        padding: 1rem;
-        border-radius: 15px 15px 15px 5px;
-        margin: 0.5rem 0;
-        margin-right: 20%;
-        border-left: 4px solid #667eea;
-        font-style: italic;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-    
-    .timestamp {
-        font-size: 0.8rem;
-        color: #666;
-        text-align: right;
-        margin-top: 0.5rem;
-    }
-    
-    .input-container {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        margin-top: 1rem;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 0.5rem 2rem;
-        font-weight: bold;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-    }
-    
-    .sidebar-info {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def _css() -> str:
+    """Custom CSS for modern styling, read from static/style.css once"""
+    with open(os.path.join(os.path.dirname(__file__), "static", "style.css")) as f:
+        return f"<style>\n{f.read()}</style>"
+
+@st.cache_resource
+def _get_supervisor():
+    """Create the supervisor once and share it across reruns"""
+    # Pass hashable config values as arguments here so cache_resource
+    # keys the real supervisor on them
+    return MockSupervisor()
+
+@st.cache_resource
+def _get_response_cache():
+    """Disk-backed cache of supervisor outputs, shared across sessions and restarts"""
+    return diskcache.Cache(RESPONSE_CACHE_DIR)
+
+def _supervisor_fingerprint(supervisor) -> str:
+    """Identify the supervisor implementation so its cached responses are not replayed for another"""
+    cls = type(supervisor)
+    return json.dumps([
+        f"{cls.__module__}.{cls.__qualname__}",
+        getattr(supervisor, "version", None),
+        getattr(supervisor, "config", None),
+    ], sort_keys=True, default=str)
+
+def _open_history_db() -> sqlite3.Connection:
+    """Open the database holding messages evicted from the in-memory window"""
+    # Each rerun of a session may execute on a different script thread
+    conn = sqlite3.connect(HISTORY_DB_PATH, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS messages ("
+        "session_id TEXT, id INTEGER, ts TEXT, type TEXT, content TEXT, "
+        "PRIMARY KEY (session_id, id))"
+    )
+    # Streamlit has no session-end hook, so drop abandoned sessions here;
+    # ts uses a sortable "%Y-%m-%d %H:%M:%S" format
+    cutoff = (datetime.now() - HISTORY_MAX_AGE).strftime("%Y-%m-%d %H:%M:%S")
+    conn.execute(
+        "DELETE FROM messages WHERE session_id IN ("
+        "SELECT session_id FROM messages GROUP BY session_id HAVING MAX(ts) < ?)",
+        (cutoff,)
+    )
+    conn.commit()
+    return conn
 
 class ChatGUI:
     def __init__(self):
-        self.supervisor = MockSupervisor()
+        self.supervisor = _get_supervisor()
+        self.response_cache = _get_response_cache()
+        self.supervisor_fingerprint = _supervisor_fingerprint(self.supervisor)
+        self.history_db = _open_history_db()
+        
+        # Formatted timestamp cache, refreshed at most once per second
+        self._timestamp_second = None
+        self._timestamp_str = ""
         
         # Initialize session state
         if 'messages' not in st.session_state:
-            st.session_state.messages = []
+            st.session_state.messages = deque(maxlen=MAX_VISIBLE_MESSAGES)
+        if 'older_messages' not in st.session_state:
+            st.session_state.older_messages = []
+        if 'next_id' not in st.session_state:
+            st.session_state.next_id = 0
+        if 'history_id' not in st.session_state:
+            st.session_state.history_id = uuid.uuid4().hex
         if 'show_thoughts' not in st.session_state:
             st.session_state.show_thoughts = True
         if 'processing' not in st.session_state:
             st.session_state.processing = False
+        if 'counts' not in st.session_state:
+            st.session_state.counts = {"user": 0, "ai_response": 0, "ai_thought": 0}
+        if 'by_type' not in st.session_state:
+            st.session_state.by_type = {"user": deque(), "ai_response": deque(), "ai_thought": deque()}
+    
+    def timestamp(self) -> str:
+        """Current time formatted for display, reformatted only when the second changes"""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_str = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        return self._timestamp_str
     
     def add_user_message(self, message: str):
         """Add user message to chat history"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        st.session_state.messages.append({
-            "type": "user",
-            "content": message,
-            "timestamp": timestamp
-        })
+        self._append_message("user", message)
     
     def add_ai_message(self, message: str, is_thought: bool = False):
         """Add AI message to chat history"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        st.session_state.messages.append({
-            "type": "ai_thought" if is_thought else "ai_response",
-            "content": message,
-            "timestamp": timestamp
+        self._append_message("ai_thought" if is_thought else "ai_response", message)
+    
+    def _append_message(self, message_type: str, content: str):
+        """Append a message, spilling the oldest one to SQLite once the window is full"""
+        messages = st.session_state.messages
+        if len(messages) == messages.maxlen:
+            self._spill_message(messages[0])
+        
+        message_id = st.session_state.next_id
+        st.session_state.next_id += 1
+        st.session_state.by_type[message_type].append(message_id)
+        messages.append({
+            "id": message_id,
+            "type": message_type,
+            "content": content,
+            "timestamp": self.timestamp()
         })
+        st.session_state.counts[message_type] += 1
+    
+    def _spill_message(self, message: dict):
+        """Persist a message that is about to leave the in-memory window"""
+        self.history_db.execute(
+            "INSERT INTO messages (session_id, id, ts, type, content) VALUES (?, ?, ?, ?, ?)",
+            (st.session_state.history_id, message["id"], message["timestamp"],
+             message["type"], message["content"])
+        )
+        self.history_db.commit()
+        # The index only covers the in-memory window
+        st.session_state.by_type[message["type"]].popleft()
+        # Keep already loaded older messages contiguous with the window,
+        # dropping the oldest so a long session does not grow without bound
+        older = st.session_state.older_messages
+        if older:
+            older.append(message)
+            del older[:-MAX_OLDER_MESSAGES]
+    
+    def first_shown_id(self) -> int:
+        """Id of the oldest message currently on the page"""
+        if st.session_state.older_messages:
+            return st.session_state.older_messages[0]["id"]
+        return st.session_state.next_id - len(st.session_state.messages)
+    
+    def load_older_messages(self):
+        """Prepend the previous batch of spilled messages"""
+        rows = self.history_db.execute(
+            "SELECT id, ts, type, content FROM messages"
+            " WHERE session_id = ? AND id < ? ORDER BY id DESC LIMIT ?",
+            (st.session_state.history_id, self.first_shown_id(), HISTORY_BATCH_SIZE)
+        ).fetchall()
+        batch = [
+            {"id": message_id, "type": message_type, "content": content, "timestamp": ts}
+            for message_id, ts, message_type, content in reversed(rows)
+        ]
+        st.session_state.older_messages = batch + st.session_state.older_messages
+    
+    def messages_of(self, message_type: str):
+        """Iterate over in-memory messages of one type without scanning the history"""
+        messages = st.session_state.messages
+        first_id = st.session_state.next_id - len(messages)
+        return (messages[i - first_id] for i in st.session_state.by_type.get(message_type, ()))
+    
+    def clear_history(self):
+        """Remove all messages along with their counters, type index and spilled rows"""
+        self.history_db.execute(
+            "DELETE FROM messages WHERE session_id = ?", (st.session_state.history_id,)
+        )
+        self.history_db.commit()
+        st.session_state.pop('pending_stream', None)
+        st.session_state.processing = False
+        st.session_state.messages = deque(maxlen=MAX_VISIBLE_MESSAGES)
+        st.session_state.older_messages = []
+        st.session_state.next_id = 0
+        st.session_state.counts = {"user": 0, "ai_response": 0, "ai_thought": 0}
+        st.session_state.by_type = {"user": deque(), "ai_response": deque(), "ai_thought": deque()}
+    
+    def render_message(self, message: dict):
+        """Render a single chat message"""
+        if message["type"] == "user":
+            with st.chat_message("user"):
+                st.write(message["content"])
+                st.caption(message["timestamp"])
+        
+        elif message["type"] == "ai_thought":
+            # Drawn inside the collapsible thoughts status of its turn
+            st.write(message["content"])
+            st.caption(message["timestamp"])
+        
+        elif message["type"] == "ai_response":
+            with st.chat_message("assistant"):
+                st.write(message["content"])
+                st.caption(message["timestamp"])
     
     def display_messages(self):
-        """Display all messages in the chat container"""
-        chat_container = st.container()
+        """Display loaded older messages followed by the in-memory window"""
+        thoughts_status = None
+        for message in chain(st.session_state.older_messages, st.session_state.messages):
+            if message["type"] == "ai_thought":
+                if not st.session_state.show_thoughts:
+                    continue
+                # Group consecutive thoughts into one collapsed status
+                if thoughts_status is None:
+                    thoughts_status = st.status("🤔 AI Thoughts", state="complete")
+                with thoughts_status:
+                    self.render_message(message)
+            else:
+                thoughts_status = None
+                self.render_message(message)
+    
+    def conversation_key(self, user_input: str) -> str:
+        """Hash the supervisor, the conversation so far and the new input into a cache key"""
+        # Thoughts are only stored when shown, so leave them out of the key
+        history = [m["content"] for m in st.session_state.messages if m["type"] != "ai_thought"]
+        return hashlib.blake2b(
+            json.dumps([self.supervisor_fingerprint, history, user_input]).encode()
+        ).hexdigest()
+    
+    def supervisor_outputs(self, user_input: str, key: str):
+        """Yield supervisor outputs, replaying cached ones for a repeated conversation"""
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            yield from cached
+            return
         
-        with chat_container:
-            for message in st.session_state.messages:
-                if message["type"] == "user":
-                    st.markdown(f"""
-                    <div class="user-message">
-                        <strong>You:</strong><br>
-                        {message["content"]}
-                        <div class="timestamp">{message["timestamp"]}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                elif message["type"] == "ai_thought" and st.session_state.show_thoughts:
-                    st.markdown(f"""
-                    <div class="ai-thoughts">
-                        <strong>🤔 AI Thoughts:</strong><br>
-                        {message["content"]}
-                        <div class="timestamp">{message["timestamp"]}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                elif message["type"] == "ai_response":
-                    st.markdown(f"""
-                    <div class="ai-message">
-                        <strong>🤖 AI Assistant:</strong><br>
-                        {message["content"]}
-                        <div class="timestamp">{message["timestamp"]}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+        outputs = []
+        for output in self.supervisor.process_input(user_input):
+            outputs.append(output)
+            # Store before yielding: the caller stops iterating at the final response
+            if output[1]:
+                self.response_cache.set(key, outputs, expire=RESPONSE_CACHE_TTL)
+            yield output
     
-    def process_user_input(self, user_input: str):
-        """Process user input and get AI response"""
+    def process_user_input(self, user_input: str, chat_container):
+        """Process user input and append the new messages to the chat container"""
         if not user_input.strip():
             return
         
+        key = self.conversation_key(user_input)
+        
         # Add user message
         self.add_user_message(user_input)
         
-        # Set processing state
+        # Keep the supervisor stream in session state so a rerun that interrupts
+        # this turn resumes it instead of calling the supervisor again.
+        # processing is set and cleared together with pending_stream.
+        st.session_state.pending_stream = self.supervisor_outputs(user_input, key)
         st.session_state.processing = True
         
-        # Create placeholders for streaming responses
-        thoughts_placeholder = st.empty()
-        response_placeholder = st.empty()
+        # Only messages from this turn are rendered; the history is already on the page
+        with chat_container:
+            self.render_message(st.session_state.messages[-1])
         
+        self.stream_pending_response(chat_container)
+    
+    def stream_pending_response(self, chat_container):
+        """Drive the pending supervisor stream until its final response"""
+        with chat_container:
+            # Native collapsible status for streaming thoughts
+            status_placeholder = st.empty()
+            thoughts_status = status_placeholder.status(
+                "🤔 Thinking...", expanded=st.session_state.show_thoughts
+            )
+        
+        response = None
         # Process with supervisor (mock for now)
-        for thought, final_response in self.supervisor.process_input(user_input):
+        for thought, final_response in st.session_state.pending_stream:
             if thought and st.session_state.show_thoughts:
                 self.add_ai_message(thought, is_thought=True)
                 # Update display in real-time
-                with thoughts_placeholder.container():
-                    st.markdown(f"""
-                    <div class="ai-thoughts">
-                        <strong>🤔 AI Thoughts:</strong><br>
-                        {thought}
-                        <div class="timestamp">{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                time.sleep(0.5)  # Simulate thinking time
+                with thoughts_status:
+                    self.render_message(st.session_state.messages[-1])
             
             if final_response:
                 self.add_ai_message(final_response, is_thought=False)
-                # Clear placeholders and refresh full display
-                thoughts_placeholder.empty()
-                response_placeholder.empty()
+                response = st.session_state.messages[-1]
                 break
         
-        # Reset processing state
+        # Clear both with no st.* call in between, so a rerun cannot leave
+        # processing set without a stream to finish
+        del st.session_state.pending_stream
         st.session_state.processing = False
+        
+        if st.session_state.show_thoughts:
+            thoughts_status.update(label="🤔 AI Thoughts", state="complete", expanded=False)
+        else:
+            status_placeholder.empty()
+        
+        # Append this turn's response below its thoughts
+        if response is not None:
+            with chat_container:
+                self.render_message(response)
+    
+    def display_statistics(self, placeholder):
+        """Render chat statistics into the given placeholder"""
+        # Running counters kept by add_user_message/add_ai_message
+        counts = st.session_state.counts
+        total_messages = sum(counts.values())
+        user_messages = counts["user"]
+        ai_messages = counts["ai_response"]
+        
+        with placeholder.container():
+            st.metric("Total Messages", total_messages)
+            st.metric("Your Messages", user_messages)
+            st.metric("AI Responses", ai_messages)
+    
+    @st.fragment
+    def _chat_fragment(self, stats_placeholder):
+        """Chat history and input form; reruns on its own when a message is sent"""
+        self.display_statistics(stats_placeholder)
+        
+        # Chat history display; new messages are appended to this container
+        chat_container = st.container()
+        with chat_container:
+            if self.first_shown_id() > 0:
+                st.button("⬆️ Load older messages", on_click=self.load_older_messages)
+            self.display_messages()
+        
+        # Input area
+        st.markdown('<div class="input-container">', unsafe_allow_html=True)
+        
+        with st.form("chat_form", clear_on_submit=True):
+            user_input = st.text_area(
+                "Type your message here...",
+                height=100,
+                placeholder="Ask me anything! I'll show you my thinking process if enabled.",
+                label_visibility="collapsed"
+            )
+            
+            col_submit, col_status = st.columns([1, 2])
+            
+            with col_submit:
+                submitted = st.form_submit_button(
+                    "🚀 Send Message", 
+                    disabled=st.session_state.processing,
+                    use_container_width=True
+                )
+            
+            with col_status:
+                if st.session_state.processing:
+                    st.info("🔄 AI is thinking...")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Finish a turn that a rerun interrupted; the rerun may have been
+        # triggered by a new submission, so handle that afterwards
+        if 'pending_stream' in st.session_state:
+            self.stream_pending_response(chat_container)
+            self.display_statistics(stats_placeholder)
+        if submitted and user_input and not st.session_state.processing:
+            self.process_user_input(user_input, chat_container)
+            self.display_statistics(stats_placeholder)
     
     def run(self):
         """Main application loop"""
+        st.markdown(_css(), unsafe_allow_html=True)
+        
         # Header
         st.markdown("""
         <div class="main-header">
@@ -243,59 +410,24 @@ class ChatGUI:
             </div>
             """, unsafe_allow_html=True)
             
-            total_messages = len(st.session_state.messages)
-            user_messages = len([m for m in st.session_state.messages if m["type"] == "user"])
-            ai_messages = len([m for m in st.session_state.messages if m["type"] == "ai_response"])
-            
-            st.metric("Total Messages", total_messages)
-            st.metric("Your Messages", user_messages)
-            st.metric("AI Responses", ai_messages)
+            # Filled by the chat fragment so it stays current between full reruns
+            stats_placeholder = st.empty()
             
             st.markdown("---")
             
             if st.button("🗑️ Clear Chat History", type="secondary"):
-                st.session_state.messages = []
+                self.clear_history()
                 st.rerun()
+            
+            if st.button("♻️ Clear Response Cache", type="secondary",
+                         help="Forget cached supervisor responses for all sessions"):
+                self.response_cache.clear()
         
         # Main chat area
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            # Chat history display
-            st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-            self.display_messages()
-            st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Input area
-            st.markdown('<div class="input-container">', unsafe_allow_html=True)
-            
-            with st.form("chat_form", clear_on_submit=True):
-                user_input = st.text_area(
-                    "Type your message here...",
-                    height=100,
-                    placeholder="Ask me anything! I'll show you my thinking process if enabled.",
-                    label_visibility="collapsed"
-                )
-                
-                col_submit, col_status = st.columns([1, 2])
-                
-                with col_submit:
-                    submitted = st.form_submit_button(
-                        "🚀 Send Message", 
-                        disabled=st.session_state.processing,
-                        use_container_width=True
-                    )
-                
-                with col_status:
-                    if st.session_state.processing:
-                        st.info("🔄 AI is thinking...")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-            
-            # Process input
-            if submitted and user_input and not st.session_state.processing:
-                self.process_user_input(user_input)
-                st.rerun()
+            self._chat_fragment(stats_placeholder)
         
         with col2:
             # Help and info
@@ -314,8 +446,10 @@ class ChatGUI:
 
 def main():
     """Main entry point"""
-    chat_gui = ChatGUI()
-    chat_gui.run()
+    # Build the GUI once per session; widget interactions rerun the script
+    if 'chat_gui' not in st.session_state:
+        st.session_state.chat_gui = ChatGUI()
+    st.session_state.chat_gui.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,6 +9,157 @@ It shows different integration patterns and provides a complete working example.
 from typing import Generator, Tuple, Optional
 import time
 import asyncio
+import functools
+import queue
+import re
+import threading
+from collections import deque, namedtuple
+from dataclasses import dataclass
+from enum import IntFlag
+from itertools import islice
+
+
+# Shared event loop for async supervisors, started on first use
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+# Marks the end of an async stream relayed through a queue
+_STREAM_END = object()
+
+class Intent(IntFlag):
+    """User intents; flags so groups of intents can be tested with one AND."""
+    QUESTION = 1
+    HELP = 2
+    CREATION = 4
+    GENERAL = 8
+
+
+# Status labels for each intent
+_INTENT_LABELS = {
+    Intent.QUESTION: "question",
+    Intent.HELP: "help_request",
+    Intent.CREATION: "creation",
+    Intent.GENERAL: "general",
+}
+
+# Intents that trigger a knowledge base search
+_KB_MASK = Intent.QUESTION | Intent.HELP
+
+# Intent keywords, checked in priority order against the input's words
+_WORD_RE = re.compile(r"\w+")
+_QUESTION_WORDS = frozenset({'question', 'what', 'how', 'why', 'when', 'where'})
+_HELP_WORDS = frozenset({'help', 'assist', 'support'})
+_CREATION_WORDS = frozenset({'create', 'generate', 'make', 'build'})
+_INTENT_KEYWORDS = (
+    (Intent.QUESTION, _QUESTION_WORDS),
+    (Intent.HELP, _HELP_WORDS),
+    (Intent.CREATION, _CREATION_WORDS),
+)
+
+# Status messages yielded by the example supervisors
+_MSG_ANALYZE = "🔍 Analyzing user input and parsing intent..."
+_MSG_CONTEXT = "🔗 Gathering relevant context from conversation history..."
+_MSG_KB_SEARCH = "🔍 Searching knowledge base for relevant information..."
+_MSG_LLM_START = "🤖 Initiating LLM processing..."
+_MSG_FINALIZE = "✨ Generating final response..."
+_MSG_ASYNC_START = "🚀 Starting async processing..."
+
+# Supervisor output tagged for benchmarking. kind is one of "status",
+# "first_token", "second_token", "thought_token" or "final"; ts_ns comes
+# from time.perf_counter_ns(), so only differences between events are meaningful.
+StreamEvent = namedtuple("StreamEvent", ["kind", "payload", "ts_ns"])
+
+# Kinds of the first LLM tokens, tagged for time-to-first/second-token metrics
+_TOKEN_KINDS = ("first_token", "second_token")
+
+# Simulated LLM thoughts streamed until a real LLM is wired in
+_DEFAULT_THOUGHTS = (
+    "🧠 Considering the user's request in detail...",
+    "🔄 Cross-referencing with previous context...",
+    "💡 Evaluating multiple response strategies...",
+    "🎯 Selecting the most appropriate approach...",
+    "✅ Preparing structured response..."
+)
+
+# Placeholder final response returned until a real LLM is wired in
+_MOCK_RESPONSE_TMPL = """
+Based on your input: "{user_input}"
+
+I've analyzed your request and here's my comprehensive response:
+
+This is where your actual LLM's response would appear. The response has been generated after considering:
+- Your conversation history
+- Relevant context and background information
+- Multiple possible approaches to address your question
+- The most appropriate tone and detail level for your needs
+
+Your actual supervisor would replace this mock response with the real output from your LLM pipeline.
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _knowledge_msg(count: int) -> str:
+    """Status message for a knowledge base search, built once per count."""
+    return f"📚 Found {count} relevant knowledge entries"
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its thread on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="async-supervisor-loop", daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
+async def _drain_into_queue(async_gen, result_queue: queue.Queue):
+    """Relay every item of an async generator into a thread-safe queue."""
+    try:
+        async for item in async_gen:
+            # Never block here: the loop is shared by every request
+            result_queue.put_nowait(item)
+    except Exception as e:
+        result_queue.put_nowait(e)
+    finally:
+        result_queue.put_nowait(_STREAM_END)
+
+
+@dataclass
+class ParsedInput:
+    """
+    User input analysed once up front and shared by every processing step.
+    """
+    raw: str
+    lower: str
+    tokens: frozenset
+    intent: Intent
+    timestamp: int  # Nanoseconds since the epoch
+
+
+class KBResult:
+    """
+    Knowledge base search result with a known size whose entries are
+    produced lazily, so processing can start before retrieval finishes.
+    """
+    
+    __slots__ = ("n", "entries")
+    
+    def __init__(self, n: int, entries):
+        """
+        Args:
+            n: Number of entries (or an estimate from the search backend)
+            entries: Iterable (or iterator) over the entries
+        """
+        self.n = n
+        self.entries = entries
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def __iter__(self):
+        return iter(self.entries)
 
 
 class YourActualSupervisor:
@@ -17,6 +168,12 @@ class YourActualSupervisor:
     to work seamlessly with the chatbot GUI.
     """
     
+    # Status message per intent, built once instead of on every request
+    _INTENT_MSG = {
+        intent: f"📝 Detected intent: {label}"
+        for intent, label in _INTENT_LABELS.items()
+    }
+    
     def __init__(self, llm_model=None, config=None):
         """
         Initialize your supervisor with your existing components.
@@ -27,12 +184,48 @@ class YourActualSupervisor:
         """
         self.llm = llm_model  # Your actual LLM
         self.config = config or {}
-        self.conversation_history = []
+        # Bounded so old turns drop off without copying the list
+        self.conversation_history = deque(maxlen=self.config.get("history_max", 20))
+        # Sleep between simulated thoughts; off so the mock streams at full speed
+        self.simulate_latency = self.config.get("simulate_latency", False)
+        # 2: status messages and LLM thoughts, 1: LLM thoughts only, 0: final response only
+        self.verbosity = self.config.get("verbosity", 2)
         
         # Initialize your existing components here
         # self.knowledge_base = YourKnowledgeBase()
         # self.context_manager = YourContextManager()
         # self.response_generator = YourResponseGenerator()
+        
+        # Set once warmup() has run; see start_warmup()
+        self.ready_event = threading.Event()
+    
+    def start_warmup(self):
+        """
+        Run warmup() in a background thread so one-time initialization costs
+        are paid before the first request. Call this once the supervisor is
+        fully constructed (including any subclass __init__).
+        """
+        threading.Thread(target=self.warmup, name="supervisor-warmup", daemon=True).start()
+    
+    def warmup(self):
+        """
+        Load lazily initialized resources so the first request does not pay for them.
+        Sets ready_event when done.
+        """
+        try:
+            # Load your tokenizer, model weights, knowledge base index, etc. here
+            # self.tokenizer = AutoTokenizer.from_pretrained(...)
+            
+            # Exercise the parsing and knowledge base paths once
+            self._parse("warmup")
+            self._search_knowledge_base("")
+        finally:
+            self.ready_event.set()
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether warmup has finished (always False until start_warmup() or warmup() is called)."""
+        return self.ready_event.is_set()
     
     def process_input(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
         """
@@ -45,73 +238,117 @@ class YourActualSupervisor:
         Yields:
             Tuple[Optional[str], Optional[str]]: (thought_process, final_response)
         """
+        for event in self.process_events(user_input):
+            if event.kind == "final":
+                yield (None, event.payload)
+            else:
+                yield (event.payload, None)
+    
+    def process_events(self, user_input: str) -> Generator[StreamEvent, None, None]:
+        """
+        Same pipeline as process_input, yielding timestamped events so
+        benchmarking tools can measure time to first and second token.
+        
+        Args:
+            user_input (str): User's message
+            
+        Yields:
+            StreamEvent: (kind, payload, ts_ns)
+        """
+        
+        # Status messages are skipped below verbosity 2, LLM thoughts below 1
+        show_status = self.verbosity >= 2
         
         # Step 1: Initial analysis
-        yield ("🔍 Analyzing user input and parsing intent...", None)
+        if show_status:
+            yield StreamEvent("status", _MSG_ANALYZE, time.perf_counter_ns())
         
         # Your actual intent parsing logic
-        intent = self._parse_intent(user_input)
-        yield (f"📝 Detected intent: {intent}", None)
+        parsed = self._parse(user_input)
+        if show_status:
+            yield StreamEvent("status", self._INTENT_MSG[parsed.intent], time.perf_counter_ns())
         
         # Step 2: Context gathering
-        yield ("🔗 Gathering relevant context from conversation history...", None)
-        context = self._gather_context(user_input)
+        if show_status:
+            yield StreamEvent("status", _MSG_CONTEXT, time.perf_counter_ns())
+        context = self._gather_context(parsed)
         
         # Step 3: Knowledge base search (if applicable)
-        if self._needs_knowledge_search(intent):
-            yield ("🔍 Searching knowledge base for relevant information...", None)
+        if self._needs_knowledge_search(parsed.intent):
+            if show_status:
+                yield StreamEvent("status", _MSG_KB_SEARCH, time.perf_counter_ns())
             knowledge = self._search_knowledge_base(user_input)
-            yield (f"📚 Found {len(knowledge)} relevant knowledge entries", None)
+            if show_status:
+                yield StreamEvent("status", _knowledge_msg(len(knowledge)), time.perf_counter_ns())
         
         # Step 4: LLM processing with streaming thoughts
-        yield ("🤖 Initiating LLM processing...", None)
+        if show_status:
+            yield StreamEvent("status", _MSG_LLM_START, time.perf_counter_ns())
         
         # This is where you'd integrate your actual LLM
-        for thought in self._stream_llm_thoughts(user_input, context):
-            yield (thought, None)
+        for index, thought in enumerate(self._stream_llm_thoughts(user_input, context)):
+            if self.verbosity >= 1:
+                kind = _TOKEN_KINDS[index] if index < len(_TOKEN_KINDS) else "thought_token"
+                yield StreamEvent(kind, thought, time.perf_counter_ns())
         
         # Step 5: Generate final response
-        yield ("✨ Generating final response...", None)
+        if show_status:
+            yield StreamEvent("status", _MSG_FINALIZE, time.perf_counter_ns())
         final_response = self._generate_final_response(user_input, context)
         
         # Step 6: Update conversation history
-        self._update_conversation_history(user_input, final_response)
+        self._update_conversation_history(user_input, final_response, timestamp=parsed.timestamp)
         
         # Yield the final response
-        yield (None, final_response)
+        yield StreamEvent("final", final_response, time.perf_counter_ns())
+    
+    def _parse(self, user_input: str) -> ParsedInput:
+        """Lowercase, tokenize and classify the input in one pass."""
+        lower = user_input.lower()
+        tokens, intent = self._parse_intent(lower)
+        return ParsedInput(
+            raw=user_input,
+            lower=lower,
+            tokens=tokens,
+            intent=intent,
+            timestamp=time.time_ns()
+        )
     
-    def _parse_intent(self, user_input: str) -> str:
-        """Parse user intent from input."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_intent(normalized: str) -> Tuple[frozenset, Intent]:
+        """Tokenize the lowercased input and parse its intent; repeated inputs hit the cache."""
         # Your actual intent parsing logic
         # For now, simple keyword-based classification
         
-        if any(word in user_input.lower() for word in ['question', 'what', 'how', 'why', 'when', 'where']):
-            return "question"
-        elif any(word in user_input.lower() for word in ['help', 'assist', 'support']):
-            return "help_request"
-        elif any(word in user_input.lower() for word in ['create', 'generate', 'make', 'build']):
-            return "creation"
-        else:
-            return "general"
+        tokens = frozenset(_WORD_RE.findall(normalized))
+        for intent, keywords in _INTENT_KEYWORDS:
+            if keywords & tokens:
+                return tokens, intent
+        return tokens, Intent.GENERAL
     
-    def _gather_context(self, user_input: str) -> dict:
+    def _gather_context(self, parsed: ParsedInput) -> dict:
         """Gather relevant context for processing."""
         # Your actual context gathering logic
         return {
-            "conversation_history": self.conversation_history[-5:],  # Last 5 messages
-            "user_input": user_input,
-            "timestamp": time.time()
+            "conversation_history": list(islice(
+                self.conversation_history, max(0, len(self.conversation_history) - 5), None
+            )),  # Last 5 messages
+            "user_input": parsed.raw,
+            "intent": parsed.intent,
+            "timestamp": parsed.timestamp
         }
     
-    def _needs_knowledge_search(self, intent: str) -> bool:
+    def _needs_knowledge_search(self, intent: Intent) -> bool:
         """Determine if knowledge base search is needed."""
-        return intent in ["question", "help_request"]
+        return bool(intent & _KB_MASK)
     
-    def _search_knowledge_base(self, query: str) -> list:
+    def _search_knowledge_base(self, query: str) -> KBResult:
         """Search your knowledge base."""
-        # Your actual knowledge base search logic
+        # Your actual knowledge base search logic, e.g.
+        # return KBResult(n=self.knowledge_base.count(query), entries=self.knowledge_base.stream(query))
         # This is a placeholder
-        return [f"Knowledge entry {i} for: {query}" for i in range(3)]
+        return KBResult(n=3, entries=(f"Knowledge entry {i} for: {query}" for i in range(3)))
     
     def _stream_llm_thoughts(self, user_input: str, context: dict) -> Generator[str, None, None]:
         """
@@ -129,17 +366,24 @@ class YourActualSupervisor:
         #     if chunk.choices[0].delta.content:
         #         yield f"🧠 LLM: {chunk.choices[0].delta.content}"
         
+        # For Hugging Face transformers models, let generate() run in a worker
+        # thread and yield tokens as soon as the streamer receives them, instead
+        # of splitting a finished response into words and sleeping between them:
+        # from transformers import TextIteratorStreamer
+        # streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        # inputs = self.tokenizer(self._build_prompt(user_input, context), return_tensors="pt")
+        # threading.Thread(
+        #     target=self.llm.generate,
+        #     kwargs={**inputs, "streamer": streamer, "max_new_tokens": 512},
+        #     daemon=True
+        # ).start()
+        # for token_text in streamer:
+        #     yield f"🧠 LLM: {token_text}"
+        
         # For now, simulate streaming thoughts
-        thoughts = [
-            "🧠 Considering the user's request in detail...",
-            "🔄 Cross-referencing with previous context...",
-            "💡 Evaluating multiple response strategies...",
-            "🎯 Selecting the most appropriate approach...",
-            "✅ Preparing structured response..."
-        ]
-        
-        for thought in thoughts:
-            time.sleep(0.5)  # Simulate processing time
+        for thought in _DEFAULT_THOUGHTS:
+            if self.simulate_latency:
+                time.sleep(0.5)  # Simulate processing time
             yield thought
     
     def _generate_final_response(self, user_input: str, context: dict) -> str:
@@ -164,30 +408,15 @@ class YourActualSupervisor:
         # return self._postprocess_output(llm_output)
         
         # For now, return a mock response
-        return f"""
-Based on your input: "{user_input}"
-
-I've analyzed your request and here's my comprehensive response:
-
-This is where your actual LLM's response would appear. The response has been generated after considering:
-- Your conversation history
-- Relevant context and background information
-- Multiple possible approaches to address your question
-- The most appropriate tone and detail level for your needs
-
-Your actual supervisor would replace this mock response with the real output from your LLM pipeline.
-"""
+        return _MOCK_RESPONSE_TMPL.format(user_input=user_input)
     
-    def _update_conversation_history(self, user_input: str, ai_response: str):
-        """Update conversation history."""
+    def _update_conversation_history(self, user_input: str, ai_response: str, timestamp: Optional[int] = None):
+        """Update conversation history (timestamp in nanoseconds since the epoch)."""
+        now = time.time_ns() if timestamp is None else timestamp
         self.conversation_history.extend([
-            {"role": "user", "content": user_input, "timestamp": time.time()},
-            {"role": "assistant", "content": ai_response, "timestamp": time.time()}
+            {"role": "user", "content": user_input, "timestamp": now},
+            {"role": "assistant", "content": ai_response, "timestamp": now}
         ])
-        
-        # Keep only recent history to avoid memory issues
-        if len(self.conversation_history) > 20:
-            self.conversation_history = self.conversation_history[-20:]
 
 
 class AsyncSupervisorExample:
@@ -195,8 +424,9 @@ class AsyncSupervisorExample:
     Example of how to integrate an async-based supervisor.
     """
     
-    def __init__(self, async_llm=None):
+    def __init__(self, async_llm=None, simulate_latency=False):
         self.async_llm = async_llm
+        self.simulate_latency = simulate_latency
     
     def process_input(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
         """
@@ -205,11 +435,9 @@ class AsyncSupervisorExample:
         """
         
         # Run async processing in sync context
-        import asyncio
-        
         async def async_process():
             # Yield initial thought
-            yield ("🚀 Starting async processing...", None)
+            yield (_MSG_ASYNC_START, None)
             
             # Your async LLM calls
             async for thought in self._async_stream_thoughts(user_input):
@@ -219,33 +447,39 @@ class AsyncSupervisorExample:
             response = await self._async_generate_response(user_input)
             yield (None, response)
         
-        # Convert async generator to sync
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Convert async generator to sync on the shared background loop
+        results = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            _drain_into_queue(async_process(), results), _get_background_loop()
+        )
         
         try:
-            async_gen = async_process()
             while True:
-                try:
-                    result = loop.run_until_complete(async_gen.__anext__())
-                    yield result
-                except StopAsyncIteration:
+                result = results.get()
+                if result is _STREAM_END:
                     break
+                if isinstance(result, Exception):
+                    raise result
+                yield result
         finally:
-            loop.close()
+            # Stop the producer if the GUI stops consuming early
+            future.cancel()
     
     async def _async_stream_thoughts(self, user_input: str):
         """Async method for streaming thoughts."""
         # Your async LLM streaming logic here
-        await asyncio.sleep(0.5)
+        if self.simulate_latency:
+            await asyncio.sleep(0.5)
         yield "🤔 Async thought processing..."
-        await asyncio.sleep(0.5)
+        if self.simulate_latency:
+            await asyncio.sleep(0.5)
         yield "⚡ Using async LLM capabilities..."
     
     async def _async_generate_response(self, user_input: str) -> str:
         """Async method for generating response."""
         # Your async response generation
-        await asyncio.sleep(1)
+        if self.simulate_latency:
+            await asyncio.sleep(1)
         return f"Async response for: {user_input}"
 
 
@@ -255,47 +489,126 @@ class SupervisorAdapter:
     Adapter class to integrate supervisors that don't follow the exact interface.
     """
     
-    def __init__(self, existing_supervisor):
+    def __init__(self, existing_supervisor, max_pending_thoughts=32, on_overflow="block"):
+        """
+        Args:
+            existing_supervisor: Supervisor instance to adapt
+            max_pending_thoughts: Callback thoughts buffered while the GUI is busy
+            on_overflow: "block" pauses the supervisor while the buffer is full,
+                "drop_oldest" discards the oldest buffered thought instead
+        """
+        if on_overflow not in ("block", "drop_oldest"):
+            raise ValueError("on_overflow must be 'block' or 'drop_oldest'")
+        
         self.supervisor = existing_supervisor
+        self.max_pending_thoughts = max_pending_thoughts
+        self.on_overflow = on_overflow
+        
+        # Resolve the supervisor's interface once instead of on every request
+        # Pattern 1: Supervisor with separate methods
+        if hasattr(existing_supervisor, 'analyze') and hasattr(existing_supervisor, 'respond'):
+            self._dispatch = self._process_analyze_respond
+        # Pattern 2: Supervisor with callback system
+        elif hasattr(existing_supervisor, 'process_with_callback'):
+            self._dispatch = self._process_with_callback
+        # Pattern 3: Simple supervisor with single method
+        elif hasattr(existing_supervisor, 'get_response'):
+            self._dispatch = self._process_get_response
+        else:
+            self._dispatch = self._process_unrecognized
     
     def process_input(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
         """
         Adapt different supervisor interfaces to work with the GUI.
         """
+        yield from self._dispatch(user_input)
+    
+    def _process_analyze_respond(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
+        """Drive a supervisor with separate analyze and respond methods."""
+        yield ("Starting analysis...", None)
+        analysis = self.supervisor.analyze(user_input)
+        yield (f"Analysis complete: {analysis}", None)
         
-        # Pattern 1: Supervisor with separate methods
-        if hasattr(self.supervisor, 'analyze') and hasattr(self.supervisor, 'respond'):
-            yield ("Starting analysis...", None)
-            analysis = self.supervisor.analyze(user_input)
-            yield (f"Analysis complete: {analysis}", None)
-            
-            yield ("Generating response...", None)
-            response = self.supervisor.respond(user_input, analysis)
-            yield (None, response)
+        yield ("Generating response...", None)
+        response = self.supervisor.respond(user_input, analysis)
+        yield (None, response)
+    
+    def _process_with_callback(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
+        """
+        Run a callback-based supervisor in a worker thread and yield its
+        thoughts as they are reported, followed by its final response.
+        """
+        yield ("Processing with callback system...", None)
         
-        # Pattern 2: Supervisor with callback system
-        elif hasattr(self.supervisor, 'process_with_callback'):
-            thoughts = []
-            
-            def thought_callback(thought):
-                thoughts.append(thought)
-            
-            yield ("Processing with callback system...", None)
-            response = self.supervisor.process_with_callback(user_input, thought_callback)
-            
-            for thought in thoughts:
-                yield (thought, None)
-            
-            yield (None, response)
+        thoughts = queue.Queue(maxsize=self.max_pending_thoughts)
+        outcome = {}
+        # Set when the consumer stops iterating; later reports are discarded
+        closed = threading.Event()
         
-        # Pattern 3: Simple supervisor with single method
-        elif hasattr(self.supervisor, 'get_response'):
-            yield ("Processing request...", None)
-            response = self.supervisor.get_response(user_input)
-            yield (None, response)
+        def put_blocking(item):
+            # Wait for room, but give up once the consumer has gone away
+            while not closed.is_set():
+                try:
+                    thoughts.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
         
-        else:
-            yield (None, "Error: Supervisor interface not recognized")
+        def put_dropping_oldest(item):
+            while True:
+                try:
+                    thoughts.put_nowait(item)
+                    return
+                except queue.Full:
+                    try:
+                        thoughts.get_nowait()
+                    except queue.Empty:
+                        pass
+        
+        put = put_blocking if self.on_overflow == "block" else put_dropping_oldest
+        
+        def report(item):
+            if not closed.is_set():
+                put(item)
+        
+        def run():
+            try:
+                outcome["response"] = self.supervisor.process_with_callback(user_input, report)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                report(_STREAM_END)
+        
+        threading.Thread(target=run, name="supervisor-callback", daemon=True).start()
+        
+        try:
+            while True:
+                thought = thoughts.get()
+                if thought is _STREAM_END:
+                    break
+                yield (thought, None)
+        finally:
+            # If the caller stopped early, unblock the worker so it can finish
+            closed.set()
+            while True:
+                try:
+                    thoughts.get_nowait()
+                except queue.Empty:
+                    break
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        yield (None, outcome["response"])
+    
+    def _process_get_response(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
+        """Drive a supervisor with a single get_response method."""
+        yield ("Processing request...", None)
+        response = self.supervisor.get_response(user_input)
+        yield (None, response)
+    
+    def _process_unrecognized(self, user_input: str) -> Generator[Tuple[Optional[str], Optional[str]], None, None]:
+        """Report a supervisor whose interface is not supported."""
+        yield (None, "Error: Supervisor interface not recognized")
 
 
 # Example usage and integration patterns
@@ -333,8 +646,11 @@ def create_production_supervisor():
         "temperature": 0.7,
         "streaming": True,
         "context_window": 5,  # Number of previous messages to include
+        "history_max": 20,  # Messages kept in conversation history
         "enable_knowledge_search": True,
-        "response_format": "structured"
+        "response_format": "structured",
+        "verbosity": 2,  # 0: final response only, 1: + LLM thoughts, 2: + status messages
+        "simulate_latency": False  # Only for the built-in mock thoughts
     }
     
     # Initialize with your actual components
@@ -342,6 +658,7 @@ def create_production_supervisor():
         llm_model=None,  # Your LLM instance here
         config=config
     )
+    supervisor.start_warmup()
     
     return supervisor
 
@@ -8,7 +8,14 @@ class MockSupervisor:
     This demonstrates how the GUI will integrate with your real supervisor code.
     """
     
-    def __init__(self):
+    def __init__(self, think_delay: float = 1.0):
+        """
+        Args:
+            think_delay (float): Average simulated thinking time per step in
+                seconds; use 0.0 to disable the delay for tests and benchmarks
+        """
+        self.think_delay = think_delay
+        
         self.sample_thoughts = [
             "Analyzing the user's request and breaking it down into components...",
             "Searching through my knowledge base for relevant information...",
@@ -46,11 +53,13 @@ class MockSupervisor:
             yield (thought, None)
             
             # Simulate processing time
-            time.sleep(random.uniform(0.5, 1.5))
+            if self.think_delay:
+                time.sleep(self.think_delay * random.uniform(0.5, 1.5))
         
         # Add a final thought about reaching conclusion
         yield ("Finalizing my response and ensuring it addresses all aspects of your question...", None)
-        time.sleep(1)
+        if self.think_delay:
+            time.sleep(self.think_delay)
         
         # Yield the final response
         final_response = f"{random.choice(self.sample_responses)}\n\nRegarding your specific question about: '{user_input}'\n\nThis response is generated by the mock supervisor. In your actual implementation, this would be replaced by your real LLM's response."